@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+CACHE_DIR_NAME = ".n0conflict-cache"
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS counts (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    count    INTEGER NOT NULL
+)
+"""
+
+
+class ScanCache:
+    """Conflict counts from earlier scans, keyed by ``(path, mtime_ns, size)``.
+
+    The cache is best-effort: if the database can't be opened or written
+    (read-only checkout, locked file, ...) every lookup simply misses.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._db: sqlite3.Connection | None = None
+        self._rows: dict[str, tuple[int, int, int]] = {}
+        self._dirty: dict[str, tuple[int, int, int] | None] = {}  # None = delete
+
+        cache_dir = root / CACHE_DIR_NAME
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            ignore = cache_dir / ".gitignore"
+            if not ignore.exists():
+                ignore.write_text("# Created by n0conflict.\n*\n", encoding="utf-8")
+            self._db = sqlite3.connect(cache_dir / "scan.sqlite3")
+            self._db.execute(_SCHEMA)
+            self._rows = {
+                path: (mtime_ns, size, count)
+                for path, mtime_ns, size, count in self._db.execute("SELECT * FROM counts")
+            }
+        except (OSError, sqlite3.Error):
+            self._rows = {}
+            self.close()
+
+    def __enter__(self) -> ScanCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get(self, path: Path, stat: os.stat_result) -> int | None:
+        """Return the cached count for *path*, or None if it is missing or stale."""
+        row = self._rows.get(str(path))
+        if row is None or row[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        return row[2]
+
+    def put(self, path: Path, stat: os.stat_result, count: int) -> None:
+        """Record *count* for *path* as it looked in *stat*."""
+        row = (stat.st_mtime_ns, stat.st_size, count)
+        self._rows[str(path)] = self._dirty[str(path)] = row
+
+    def prune(self, seen: set[str]) -> None:
+        """Forget every cached path that is not in *seen*."""
+        for path in self._rows.keys() - seen:
+            del self._rows[path]
+            self._dirty[path] = None
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._db is None:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    "DELETE FROM counts WHERE path = ?",
+                    [(path,) for path, row in self._dirty.items() if row is None],
+                )
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO counts VALUES (?, ?, ?, ?)",
+                    [(path, *row) for path, row in self._dirty.items() if row is not None],
+                )
+        except sqlite3.Error:
+            pass
+        finally:
+            self._db.close()
+            self._db = None
+            self._dirty.clear()
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import mmap
+import os
 import re
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
-_CONFLICT_START = re.compile(r"^<{7} ", re.MULTILINE)
+_CONFLICT_START_BYTES = re.compile(rb"^<{7} ", re.MULTILINE)
+# (newline, start, separator, end) needles for text and bytes-like buffers.
+_NEEDLES = ("\n", "<<<<<<< ", "=======", ">>>>>>>")
+_NEEDLES_BYTES = (b"\n", b"<<<<<<< ", b"=======", b">>>>>>>")
+# Largest slice copied out of an mmap at once when counting lines.
+_COUNT_CHUNK = 1 << 20
 
+# Offsets of one conflict block within its buffer:
+# (start, ours_start, sep, theirs_start, close, end) where ours is
+# buf[ours_start:sep], theirs is buf[theirs_start:close] and the whole block,
+# markers included, is buf[start:end].
+ConflictSpan = tuple[int, int, int, int, int, int]
 
-@dataclass
+
+@dataclass(slots=True)
 class ConflictBlock:
     ours_label: str
     ours: str
@@ -16,74 +31,188 @@ class ConflictBlock:
     start: int  # 1-indexed line number of the opening marker
     end: int    # 1-indexed line number of the closing marker
     raw: str    # exact bytes from the file — used for in-place replacement
+    # Where the block sits in the source: string offsets into the content given
+    # to parse_conflicts, or byte offsets into the file for
+    # parse_conflicts_from_path. Only the former can be used to splice raw.
+    start_offset: int
+    end_offset: int
+
+
+def parse_conflicts_spans(buf: str | bytes | mmap.mmap) -> list[ConflictSpan]:
+    """Return the offsets of every conflict block in *buf*.
+
+    *buf* may be text or any bytes-like object (including an mmap); nothing is
+    copied out of it, so callers slice only the parts they need.
+    """
+    nl, start_marker, sep_marker, end_marker = _NEEDLES if isinstance(buf, str) else _NEEDLES_BYTES
+    spans: list[ConflictSpan] = []
+
+    # Jump from marker to marker with find(); the text in between is never
+    # looked at line by line. Every search starts at the beginning of a line.
+    pos = 0
+    while True:
+        start = _find_marker(buf, nl, start_marker, pos)
+        if start == -1:
+            break
+        ours_start = _line_end(buf, nl, start)
+        sep = _find_marker(buf, nl, sep_marker, ours_start)
+        if sep == -1:
+            break
+        theirs_start = _line_end(buf, nl, sep)
+        close = _find_marker(buf, nl, end_marker, theirs_start)
+        if close == -1:
+            break
+        pos = _line_end(buf, nl, close)
+        spans.append((start, ours_start, sep, theirs_start, close, pos))
+
+    return spans
+
+
+def _find_marker(buf: str | bytes | mmap.mmap, nl: str | bytes, marker: str | bytes, pos: int) -> int:
+    """Return the offset of the first line at or after *pos* starting with *marker*."""
+    if pos == 0:
+        if buf[:len(marker)] == marker:
+            return 0
+        found = buf.find(nl + marker)
+    else:
+        # *pos* follows a newline, so back up one to catch a marker right at it.
+        found = buf.find(nl + marker, pos - 1)
+    return -1 if found == -1 else found + 1
+
+
+def _line_end(buf: str | bytes | mmap.mmap, nl: str | bytes, pos: int) -> int:
+    """Return the offset just past the line containing *pos*."""
+    found = buf.find(nl, pos)
+    return len(buf) if found == -1 else found + 1
 
 
 def parse_conflicts(content: str) -> list[ConflictBlock]:
     """Return every conflict block found in *content*."""
     conflicts: list[ConflictBlock] = []
-    lines = content.splitlines(keepends=True)
+    line, pos = 1, 0
 
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    for start, ours_start, sep, theirs_start, close, end in parse_conflicts_spans(content):
+        line += content.count("\n", pos, start)
+        pos = start
+        conflicts.append(
+            ConflictBlock(
+                ours_label=content[start + 8:ours_start].rstrip("\r\n"),
+                ours=content[ours_start:sep],
+                theirs_label=content[close + 8:end].rstrip("\r\n"),
+                theirs=content[theirs_start:close],
+                start=line,
+                end=line + content.count("\n", start, close),
+                raw=content[start:end],
+                start_offset=start,
+                end_offset=end,
+            )
+        )
 
-        if not line.startswith("<<<<<<< "):
-            i += 1
-            continue
+    return conflicts
 
-        start_line = i + 1
-        ours_label = line[8:].rstrip("\r\n")
-        block_lines = [line]
 
-        # Collect "ours" side
-        ours_lines: list[str] = []
-        i += 1
-        while i < len(lines) and not lines[i].startswith("======="):
-            ours_lines.append(lines[i])
-            block_lines.append(lines[i])
-            i += 1
+def count_conflicts(buf: str | bytes | mmap.mmap) -> int:
+    """Return the number of conflict blocks in *buf* without building them."""
+    return len(parse_conflicts_spans(buf))
 
-        if i >= len(lines):
-            break
 
-        block_lines.append(lines[i])  # separator line
-        i += 1
+def count_conflicts_in_file(path: Path) -> int:
+    """Return the number of conflict blocks in the file at *path*.
 
-        # Collect "theirs" side
-        theirs_lines: list[str] = []
-        while i < len(lines) and not lines[i].startswith(">>>>>>>"):
-            theirs_lines.append(lines[i])
-            block_lines.append(lines[i])
-            i += 1
+    The file is memory-mapped and never decoded. Raises :class:`OSError` if it
+    can't be read.
+    """
+    with _mapped(path) as buf:
+        return count_conflicts(buf)
 
-        if i >= len(lines):
-            break
 
-        theirs_label = lines[i][8:].rstrip("\r\n")
-        block_lines.append(lines[i])
-        end_line = i + 1
+def parse_conflicts_from_path(path: Path) -> list[ConflictBlock]:
+    """Return every conflict block in the file at *path*.
 
-        conflicts.append(
-            ConflictBlock(
-                ours_label=ours_label,
-                ours="".join(ours_lines),
-                theirs_label=theirs_label,
-                theirs="".join(theirs_lines),
-                start=start_line,
-                end=end_line,
-                raw="".join(block_lines),
-            )
-        )
+    The file is memory-mapped and only the bytes inside conflict blocks are
+    decoded, so a clean file is never decoded at all. Offsets on the returned
+    blocks are byte offsets into the file, while the text fields are decoded
+    and newline-normalised, so the two don't line up for splicing.
+    """
+    conflicts: list[ConflictBlock] = []
+    try:
+        with _mapped(path) as buf:
+            line, pos = 1, 0
+            for start, ours_start, sep, theirs_start, close, end in parse_conflicts_spans(buf):
+                line += _count_newlines(buf, pos, start)
+                pos = start
+                conflicts.append(
+                    ConflictBlock(
+                        ours_label=_decode(buf[start + 8:ours_start]).rstrip("\r\n"),
+                        ours=_decode(buf[ours_start:sep]),
+                        theirs_label=_decode(buf[close + 8:end]).rstrip("\r\n"),
+                        theirs=_decode(buf[theirs_start:close]),
+                        start=line,
+                        end=line + _count_newlines(buf, start, close),
+                        raw=_decode(buf[start:end]),
+                        start_offset=start,
+                        end_offset=end,
+                    )
+                )
+    except (OSError, ValueError):
+        return []
+    return conflicts
 
-        i += 1
 
-    return conflicts
+def read_conflicted(path: Path) -> tuple[str | None, bool]:
+    """Read *path* once and report whether it contains conflict markers.
+
+    Returns ``(content, has_markers)``. Content is only decoded when markers
+    are present, and is None if the file is not valid UTF-8.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None, False
+    if not _CONFLICT_START_BYTES.search(data):
+        return None, False
+    try:
+        return _normalize_newlines(data.decode("utf-8")), True
+    except UnicodeDecodeError:
+        return None, True
 
 
 def has_conflicts(path: Path) -> bool:
     """Return True if *path* contains Git conflict markers."""
     try:
-        content = path.read_text(encoding="utf-8", errors="replace")
-        return bool(_CONFLICT_START.search(content))
-    except OSError:
+        with _mapped(path) as buf:
+            return _CONFLICT_START_BYTES.search(buf) is not None
+    except (OSError, ValueError):
         return False
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Map *path* read-only for the duration of the block."""
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files, and they can't hold markers anyway.
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _count_newlines(buf: bytes | mmap.mmap, start: int, end: int) -> int:
+    """Count newlines in ``buf[start:end]`` without copying more than a chunk at a time."""
+    count = 0
+    for pos in range(start, end, _COUNT_CHUNK):
+        count += buf[pos:min(pos + _COUNT_CHUNK, end)].count(b"\n")
+    return count
+
+
+def _decode(data: bytes) -> str:
+    """Decode a slice of a file the way ``read_text(errors="replace")`` would."""
+    return _normalize_newlines(data.decode("utf-8", errors="replace"))
+
+
+def _normalize_newlines(text: str) -> str:
+    """Apply ``read_text()``'s universal-newline translation to *text*."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
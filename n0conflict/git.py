@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import subprocess
 from pathlib import Path
 
 _EXT_LANGUAGE_MAP: dict[str, str] = {
@@ -29,16 +31,32 @@ _EXT_LANGUAGE_MAP: dict[str, str] = {
 }
 
 
-def get_conflicted_files(repo_path: Path) -> list[Path]:
-    """Return files that Git has marked as unmerged in *repo_path*."""
+def get_conflicted_files(repo_path: Path) -> tuple[bool, list[Path]]:
+    """Return whether *repo_path* is inside a Git repository, and its unmerged files."""
     try:
-        import git
+        toplevel = subprocess.run(
+            ["git", "-C", str(repo_path), "rev-parse", "--show-toplevel"],
+            capture_output=True,
+        )
+    except Exception:
+        return False, []
+    if toplevel.returncode != 0:
+        return False, []
 
-        repo = git.Repo(repo_path, search_parent_directories=True)
-        root = Path(repo.working_tree_dir)
-        return [(root / Path(name)).resolve() for name in repo.index.unmerged_blobs().keys()]
+    try:
+        root = Path(os.fsdecode(toplevel.stdout.rstrip(b"\r\n")))
+        unmerged = subprocess.run(
+            ["git", "-C", str(root), "diff", "--name-only", "--diff-filter=U", "-z"],
+            capture_output=True,
+            check=True,
+        )
+        return True, [
+            (root / os.fsdecode(name)).resolve()
+            for name in unmerged.stdout.split(b"\0")
+            if name
+        ]
     except Exception:
-        return []
+        return True, []
 
 
 def detect_language(path: Path) -> str:
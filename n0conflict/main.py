@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
-import anthropic
 import typer
+from pygments.lexer import Lexer
+from pygments.lexers import TextLexer, get_lexer_by_name
+from pygments.util import ClassNotFound
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
@@ -14,7 +17,13 @@ from rich.syntax import Syntax
 from rich.table import Table
 
 from . import __version__
-from .conflict import has_conflicts, parse_conflicts
+from .cache import ScanCache
+from .conflict import (
+    count_conflicts_in_file,
+    parse_conflicts,
+    parse_conflicts_from_path,
+    read_conflicted,
+)
 from .git import detect_language, get_conflicted_files
 from .resolver import AIResolver
 
@@ -66,6 +75,44 @@ def _get_resolver() -> AIResolver:
     return AIResolver(api_key)
 
 
+@functools.lru_cache(maxsize=32)
+def _lexer_for(name: str) -> Lexer:
+    """Return a Pygments lexer for *name*, falling back to plain text."""
+    try:
+        return get_lexer_by_name(name)
+    except ClassNotFound:
+        return TextLexer()
+
+
+def _iter_candidate_files(root: Path) -> Iterator[Path]:
+    """Yield regular files under *root*, pruning hidden directories as we go."""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
+def _scan_one(path: Path) -> int | None:
+    """Return the number of conflicts in *path*, or None if it can't be read."""
+    try:
+        return count_conflicts_in_file(path)
+    except (OSError, ValueError):
+        return None
+
+
 def _version_callback(value: bool) -> None:
     if value:
         rprint(f"n0conflict [bold cyan]v{__version__}[/]")
@@ -109,13 +156,12 @@ def resolve(
         rprint(f"[bold red]Error:[/] File not found: {file}")
         raise typer.Exit(code=1)
 
-    if not has_conflicts(file):
+    content, found = read_conflicted(file)
+    if not found:
         rprint(f"[green]✓[/] No conflicts found in [bold]{file}[/]")
         return
 
-    try:
-        content = file.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
+    if content is None:
         rprint(f"[bold red]Error:[/] Cannot read {file} — invalid UTF-8 encoding.")
         raise typer.Exit(code=1)
 
@@ -131,29 +177,25 @@ def resolve(
     rprint(f"\n[bold]n0conflict[/] — [cyan]{file}[/]")
     rprint(f"  Found [yellow]{len(conflicts)}[/] conflict block(s)\n")
 
-    resolved_content = content
+    splices: list[tuple[int, int, str]] = []
     all_resolved = True
 
-    for idx, conflict in enumerate(conflicts, start=1):
-        with Progress(
-            SpinnerColumn(),
-            TextColumn(f"[progress.description]Resolving conflict {idx}/{len(conflicts)}..."),
-            transient=True,
-            console=console,
-        ) as progress:
-            progress.add_task("resolve", total=None)
-            try:
-                result = resolver.resolve(conflict, language=language)
-            except anthropic.APIError as e:
-                all_resolved = False
-                rprint(f"  [red]✗[/] Conflict {idx}: API error — {e}")
-                continue
-
-        if result.resolved:
+    with Progress(
+        SpinnerColumn(),
+        TextColumn(f"[progress.description]Resolving {len(conflicts)} conflict(s)..."),
+        transient=True,
+        console=console,
+    ) as progress:
+        progress.add_task("resolve", total=None)
+        results = resolver.resolve_many(conflicts, language=language)
+
+    for idx, (conflict, result) in enumerate(zip(conflicts, results), start=1):
+        if result.error:
+            all_resolved = False
+            rprint(f"  [red]✗[/] Conflict {idx}: API error — {result.explanation}")
+        elif result.resolved:
             rprint(f"  [green]✓[/] Conflict {idx}: {result.explanation}")
-            pos = resolved_content.find(conflict.raw)
-            if pos != -1:
-                resolved_content = resolved_content[:pos] + result.content + resolved_content[pos + len(conflict.raw):]
+            splices.append((conflict.start_offset, conflict.end_offset, result.content))
         else:
             all_resolved = False
             rprint(f"  [red]✗[/] Conflict {idx}: cannot be resolved automatically")
@@ -169,9 +211,19 @@ def resolve(
         rprint("\n[yellow]Some conflicts require manual resolution.[/]")
         return
 
+    # Blocks come back in file order, so one pass rebuilds the file.
+    parts: list[str] = []
+    prev_end = 0
+    for start, end, replacement in splices:
+        parts.append(content[prev_end:start])
+        parts.append(replacement)
+        prev_end = end
+    parts.append(content[prev_end:])
+    resolved_content = "".join(parts)
+
     if dry_run:
         lexer = language.lower().split()[0] if language else "text"
-        syntax = Syntax(resolved_content, lexer, theme="monokai", line_numbers=True)
+        syntax = Syntax(resolved_content, _lexer_for(lexer), theme="monokai", line_numbers=True)
         console.print(Panel(syntax, title=f"[green]Preview: {file}[/]", border_style="green"))
     elif write:
         file.write_text(resolved_content, encoding="utf-8")
@@ -191,19 +243,48 @@ def scan(
     if path is None:
         path = Path.cwd()
     path = path.resolve()
-    # Prefer Git index (accurate) with a text-scan fallback.
-    conflicted = get_conflicted_files(path)
-
-    if not conflicted:
-        conflicted = [
-            f
-            for f in path.rglob("*")
-            if f.is_file()
-            and not any(part.startswith(".") for part in f.parts)
-            and has_conflicts(f)
-        ]
-
-    if not conflicted:
+    # Inside a repository the Git index is authoritative; only walk the tree
+    # when there is no index to ask.
+    is_repo, conflicted = get_conflicted_files(path)
+    # None marks a path Git reports as unmerged that can't be counted, e.g. a
+    # deleted file in a modify/delete conflict or a submodule.
+    counts: dict[Path, int | None] = {}
+
+    if is_repo:
+        for f in conflicted:
+            counts[f] = _scan_one(f)
+    else:
+        with ScanCache(path) as cache:
+            # Unchanged files keep their count from the previous scan.
+            pending: list[tuple[Path, os.stat_result]] = []
+            seen: set[str] = set()
+            for f in _iter_candidate_files(path):
+                seen.add(str(f))
+                try:
+                    stat = f.stat()
+                except OSError:
+                    continue
+                count = cache.get(f, stat)
+                if count is None:
+                    pending.append((f, stat))
+                elif count:
+                    counts[f] = count
+
+            # Sequential on purpose: reads of a mapped file happen as page
+            # faults inside find(), which holds the GIL, so threads don't
+            # overlap the I/O.
+            for f, stat in pending:
+                count = _scan_one(f)
+                if count is None:
+                    continue
+                cache.put(f, stat, count)
+                if count:
+                    counts[f] = count
+
+            # Drop entries for files that have since been deleted.
+            cache.prune(seen)
+
+    if not (conflicted if is_repo else counts):
         rprint("[green]✓[/] No merge conflicts found.")
         return
 
@@ -216,16 +297,13 @@ def scan(
     table.add_column("File", style="cyan", no_wrap=True)
     table.add_column("Conflicts", justify="right", style="yellow")
 
-    for f in sorted(conflicted):
+    for f in sorted(counts):
         try:
-            count = len(parse_conflicts(f.read_text(encoding="utf-8", errors="replace")))
-            try:
-                display = str(f.resolve().relative_to(path))
-            except ValueError:
-                display = str(f)
-            table.add_row(display, str(count))
-        except OSError:
-            pass
+            display = str(f.resolve().relative_to(path))
+        except ValueError:
+            display = str(f)
+        count = counts[f]
+        table.add_row(display, "?" if count is None else str(count))
 
     console.print(table)
     rprint(
@@ -242,12 +320,8 @@ def explain(
         rprint(f"[bold red]Error:[/] File not found: {file}")
         raise typer.Exit(code=1)
 
-    if not has_conflicts(file):
-        rprint(f"[green]✓[/] No conflicts found in [bold]{file}[/]")
-        return
-
-    content = file.read_text(encoding="utf-8")
-    conflicts = parse_conflicts(content)
+    # Only the conflict blocks are decoded, however large the file is.
+    conflicts = parse_conflicts_from_path(file)
 
     if not conflicts:
         rprint(f"[green]✓[/] No conflicts found in [bold]{file}[/]")
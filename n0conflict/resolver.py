@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import re
 from dataclasses import dataclass
+from typing import Any
 
 from .conflict import ConflictBlock
 
@@ -25,21 +29,49 @@ code that satisfies the intent of BOTH sides. Follow these rules strictly:
 
    CANNOT_RESOLVE:
    <clear explanation of why the conflict cannot be automatically resolved>
+
+6. When given several conflicts, each introduced by a `--- CONFLICT <n> ---`
+   header, resolve each one independently. Answer every conflict in order under
+   a matching `--- RESULT <n> ---` header line, using one of the two formats
+   above for each.
 """
 
+# HTTP/2 lets concurrent requests share one connection, but needs the optional
+# h2 package; without it the clients stay on pooled HTTP/1.1.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+_RESULT_HEADER = re.compile(r"^--- RESULT (\d+) ---[ \t]*$", re.MULTILINE)
+
+# Batched answers grow with the number of blocks; stay well inside what the
+# API accepts for a non-streaming request.
+_MAX_TOKENS = 4096
+_MAX_BATCH_TOKENS = 16384
+
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     resolved: bool
     content: str       # the merged code, or empty string on failure
     explanation: str   # brief summary always present
+    error: bool = False  # the API request itself failed; explanation says why
 
 
 class AIResolver:
+    # One sync client per API key, shared by every resolver in the process so
+    # follow-up requests reuse the open connection instead of a new handshake.
+    _clients: dict[str, Any] = {}
+
     def __init__(self, api_key: str, model: str = "claude-opus-4-6") -> None:
         import anthropic
 
-        self._client = anthropic.Anthropic(api_key=api_key)
+        client = AIResolver._clients.get(api_key)
+        if client is None:
+            client = AIResolver._clients[api_key] = anthropic.Anthropic(
+                api_key=api_key,
+                http_client=anthropic.DefaultHttpxClient(http2=_HTTP2),
+            )
+        self._client = client
+        self._api_key = api_key
         self._model = model
 
     def resolve(
@@ -48,30 +80,158 @@ class AIResolver:
         language: str = "",
     ) -> ResolutionResult:
         """Ask the AI to resolve a single *conflict* block."""
-        language_hint = f" The file is written in {language}." if language else ""
+        response = self._client.messages.create(**self._single_request(conflict, language))
+        return _result_from_response(response)
+
+    async def resolve_async(
+        self,
+        conflict: ConflictBlock,
+        language: str = "",
+    ) -> ResolutionResult:
+        """Async counterpart of :meth:`resolve`."""
+        async with self._new_async_client() as client:
+            return await self._resolve_with(client, conflict, language)
+
+    def resolve_many(
+        self,
+        conflicts: list[ConflictBlock],
+        language: str = "",
+    ) -> list[ResolutionResult]:
+        """Resolve every block in *conflicts* with a single request.
+
+        Falls back to one request per block if the batched answer does not
+        contain exactly one result per conflict, or if the API rejects the
+        batched request as malformed. API errors come back as failed results
+        for the blocks they affect instead of being raised.
+        """
+        import anthropic
+
+        if len(conflicts) > 1:
+            try:
+                results = self._resolve_batch(conflicts, language)
+            except anthropic.BadRequestError:
+                # The combined prompt may be what was rejected; smaller
+                # per-block requests can still succeed.
+                results = []
+            except anthropic.APIError as e:
+                # Auth, rate-limit and connection errors would hit every
+                # per-block request too, so don't multiply the traffic.
+                return [_error_result(e) for _ in conflicts]
+            if len(results) == len(conflicts):
+                return results
+        return asyncio.run(self._resolve_each(conflicts, language))
 
+    def _resolve_batch(
+        self,
+        conflicts: list[ConflictBlock],
+        language: str,
+    ) -> list[ResolutionResult]:
+        """Send all *conflicts* in one request; return [] if the answer doesn't parse."""
+        language_hint = f" The file is written in {language}." if language else ""
+        sections = "\n".join(
+            f"--- CONFLICT {idx} ---\n{_format_conflict(conflict)}"
+            for idx, conflict in enumerate(conflicts, start=1)
+        )
         user_message = (
-            f"Resolve the following Git merge conflict.{language_hint}\n\n"
-            f"--- OURS ({conflict.ours_label}) ---\n"
-            f"{conflict.ours}\n"
-            f"--- THEIRS ({conflict.theirs_label}) ---\n"
-            f"{conflict.theirs}"
+            f"Resolve each of the following {len(conflicts)} Git merge conflicts."
+            f"{language_hint}\n\n{sections}"
         )
 
         response = self._client.messages.create(
             model=self._model,
-            max_tokens=4096,
+            max_tokens=min(_MAX_TOKENS * len(conflicts), _MAX_BATCH_TOKENS),
             system=_SYSTEM_PROMPT,
             messages=[{"role": "user", "content": user_message}],
         )
 
-        if not response.content:
-            return ResolutionResult(
-                resolved=False,
-                content="",
-                explanation="API returned an empty response.",
+        if not response.content or response.stop_reason == "max_tokens":
+            return []
+        return _parse_multi_response(response.content[0].text, len(conflicts))
+
+    async def _resolve_each(
+        self,
+        conflicts: list[ConflictBlock],
+        language: str,
+    ) -> list[ResolutionResult]:
+        """Resolve each block with its own request, all in flight at once."""
+        import anthropic
+
+        # One client per event loop: it's opened and closed inside this run.
+        async with self._new_async_client() as client:
+            outcomes = await asyncio.gather(
+                *(self._resolve_with(client, conflict, language) for conflict in conflicts),
+                return_exceptions=True,
             )
-        return _parse_response(response.content[0].text)
+        results: list[ResolutionResult] = []
+        for outcome in outcomes:
+            if isinstance(outcome, anthropic.APIError):
+                results.append(_error_result(outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
+        return results
+
+    async def _resolve_with(
+        self,
+        client: Any,
+        conflict: ConflictBlock,
+        language: str,
+    ) -> ResolutionResult:
+        """Resolve one *conflict* through the async *client*."""
+        response = await client.messages.create(**self._single_request(conflict, language))
+        return _result_from_response(response)
+
+    def _new_async_client(self) -> Any:
+        """Build an async client; use it as a context manager so it gets closed."""
+        import anthropic
+
+        return anthropic.AsyncAnthropic(
+            api_key=self._api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(http2=_HTTP2),
+        )
+
+    def _single_request(self, conflict: ConflictBlock, language: str) -> dict:
+        """Build the ``messages.create`` arguments for one *conflict*."""
+        language_hint = f" The file is written in {language}." if language else ""
+
+        user_message = (
+            f"Resolve the following Git merge conflict.{language_hint}\n\n"
+            f"{_format_conflict(conflict)}"
+        )
+
+        return {
+            "model": self._model,
+            "max_tokens": _MAX_TOKENS,
+            "system": _SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+
+
+def _format_conflict(conflict: ConflictBlock) -> str:
+    """Render both sides of *conflict* for the user message."""
+    return (
+        f"--- OURS ({conflict.ours_label}) ---\n"
+        f"{conflict.ours}\n"
+        f"--- THEIRS ({conflict.theirs_label}) ---\n"
+        f"{conflict.theirs}"
+    )
+
+
+def _error_result(error: Exception) -> ResolutionResult:
+    """Describe a failed API request as a :class:`ResolutionResult`."""
+    return ResolutionResult(resolved=False, content="", explanation=str(error), error=True)
+
+
+def _result_from_response(response) -> ResolutionResult:
+    """Turn a ``messages.create`` response into a :class:`ResolutionResult`."""
+    if not response.content:
+        return ResolutionResult(
+            resolved=False,
+            content="",
+            explanation="API returned an empty response.",
+        )
+    return _parse_response(response.content[0].text)
 
 
 def _parse_response(text: str) -> ResolutionResult:
@@ -100,3 +260,17 @@ def _parse_response(text: str) -> ResolutionResult:
         content=text,
         explanation="Conflict resolved.",
     )
+
+
+def _parse_multi_response(text: str, count: int) -> list[ResolutionResult]:
+    """Split a batched response into one :class:`ResolutionResult` per block.
+
+    Returns an empty list unless the response holds exactly *count* results
+    numbered 1 to *count* in order.
+    """
+    # re.split yields [preamble, "1", body, "2", body, ...]
+    parts = _RESULT_HEADER.split(text)
+    numbers = [int(n) for n in parts[1::2]]
+    if numbers != list(range(1, count + 1)):
+        return []
+    return [_parse_response(body) for body in parts[2::2]]
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+from n0conflict.cache import CACHE_DIR_NAME, ScanCache
+
+
+class TestScanCache:
+    def test_round_trip(self, tmp_path: Path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        stat = f.stat()
+        with ScanCache(tmp_path) as cache:
+            assert cache.get(f, stat) is None
+            cache.put(f, stat, 2)
+        with ScanCache(tmp_path) as cache:
+            assert cache.get(f, stat) == 2
+
+    def test_stale_entry_misses(self, tmp_path: Path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        with ScanCache(tmp_path) as cache:
+            cache.put(f, f.stat(), 1)
+        f.write_text("x = 10\n")
+        with ScanCache(tmp_path) as cache:
+            assert cache.get(f, f.stat()) is None
+
+    def test_prune_drops_unseen_paths(self, tmp_path: Path):
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        stat = f.stat()
+        with ScanCache(tmp_path) as cache:
+            cache.put(f, stat, 1)
+        with ScanCache(tmp_path) as cache:
+            cache.prune(set())
+        with ScanCache(tmp_path) as cache:
+            assert cache.get(f, stat) is None
+
+    def test_unwritable_root_disables_cache(self, tmp_path: Path):
+        (tmp_path / CACHE_DIR_NAME).write_text("not a directory")
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        with ScanCache(tmp_path) as cache:
+            cache.put(f, f.stat(), 1)
+        with ScanCache(tmp_path) as cache:
+            assert cache.get(f, f.stat()) is None
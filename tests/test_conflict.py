@@ -1,7 +1,16 @@
 import tempfile
 from pathlib import Path
 
-from n0conflict.conflict import ConflictBlock, has_conflicts, parse_conflicts
+from n0conflict.conflict import (
+    ConflictBlock,
+    count_conflicts,
+    count_conflicts_in_file,
+    has_conflicts,
+    parse_conflicts,
+    parse_conflicts_from_path,
+    parse_conflicts_spans,
+    read_conflicted,
+)
 
 SIMPLE_CONFLICT = """\
 def greet(name):
@@ -65,6 +74,91 @@ class TestParseConflicts:
         assert block.start == 2   # second line of the file
         assert block.end == 6
 
+    def test_offsets_locate_raw(self):
+        for block in parse_conflicts(DOUBLE_CONFLICT):
+            assert DOUBLE_CONFLICT[block.start_offset:block.end_offset] == block.raw
+
+
+class TestParseConflictsSpans:
+    def test_bytes_match_text(self):
+        assert parse_conflicts_spans(DOUBLE_CONFLICT.encode()) == parse_conflicts_spans(DOUBLE_CONFLICT)
+
+    def test_slices(self):
+        start, ours_start, sep, theirs_start, close, end = parse_conflicts_spans(SIMPLE_CONFLICT)[0]
+        block = parse_conflicts(SIMPLE_CONFLICT)[0]
+        assert SIMPLE_CONFLICT[start:end] == block.raw
+        assert SIMPLE_CONFLICT[ours_start:sep] == block.ours
+        assert SIMPLE_CONFLICT[theirs_start:close] == block.theirs
+
+    def test_no_conflicts_returns_empty(self):
+        assert parse_conflicts_spans(b"def foo(): pass\n") == []
+
+
+class TestCountConflicts:
+    def test_counts_blocks(self):
+        assert count_conflicts(DOUBLE_CONFLICT) == 2
+
+    def test_counts_bytes(self):
+        assert count_conflicts(DOUBLE_CONFLICT.encode()) == 2
+
+    def test_clean_content(self):
+        assert count_conflicts(b"x = 1\n") == 0
+
+    def test_counts_file(self, tmp_path: Path):
+        f = tmp_path / "dirty.py"
+        f.write_text(DOUBLE_CONFLICT)
+        assert count_conflicts_in_file(f) == 2
+
+    def test_empty_file(self, tmp_path: Path):
+        f = tmp_path / "empty.py"
+        f.write_text("")
+        assert count_conflicts_in_file(f) == 0
+
+
+class TestParseConflictsFromPath:
+    def test_matches_parse_conflicts(self, tmp_path: Path):
+        f = tmp_path / "dirty.py"
+        f.write_text(DOUBLE_CONFLICT)
+        from_path = parse_conflicts_from_path(f)
+        from_text = parse_conflicts(DOUBLE_CONFLICT)
+        assert [(b.ours, b.theirs, b.raw, b.start, b.end) for b in from_path] == [
+            (b.ours, b.theirs, b.raw, b.start, b.end) for b in from_text
+        ]
+
+    def test_clean_file(self, tmp_path: Path):
+        f = tmp_path / "clean.py"
+        f.write_text("x = 1\n")
+        assert parse_conflicts_from_path(f) == []
+
+    def test_missing_file(self, tmp_path: Path):
+        assert parse_conflicts_from_path(tmp_path / "nonexistent.py") == []
+
+    def test_line_numbers_across_count_chunks(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr("n0conflict.conflict._COUNT_CHUNK", 4)
+        content = "pad\n" * 25 + DOUBLE_CONFLICT
+        f = tmp_path / "dirty.py"
+        f.write_text(content)
+        assert [(b.start, b.end) for b in parse_conflicts_from_path(f)] == [
+            (b.start, b.end) for b in parse_conflicts(content)
+        ]
+
+
+class TestReadConflicted:
+    def test_conflicted_file(self, tmp_path: Path):
+        f = tmp_path / "dirty.py"
+        f.write_bytes(SIMPLE_CONFLICT.replace("\n", "\r\n").encode())
+        assert read_conflicted(f) == (SIMPLE_CONFLICT, True)
+
+    def test_clean_file(self, tmp_path: Path):
+        f = tmp_path / "clean.py"
+        f.write_text("x = 1\n")
+        assert read_conflicted(f) == (None, False)
+
+    def test_invalid_utf8(self, tmp_path: Path):
+        f = tmp_path / "bad.py"
+        f.write_bytes(SIMPLE_CONFLICT.encode() + b"\xff\n")
+        assert read_conflicted(f) == (None, True)
+
 
 class TestHasConflicts:
     def test_clean_file(self, tmp_path: Path):
@@ -79,3 +173,8 @@ class TestHasConflicts:
 
     def test_missing_file(self, tmp_path: Path):
         assert has_conflicts(tmp_path / "nonexistent.py") is False
+
+    def test_empty_file(self, tmp_path: Path):
+        f = tmp_path / "empty.py"
+        f.write_text("")
+        assert has_conflicts(f) is False
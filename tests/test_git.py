@@ -0,0 +1,53 @@
+import subprocess
+from pathlib import Path
+
+from n0conflict.git import get_conflicted_files
+
+
+def _git(repo: Path, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo),
+            "-c",
+            "user.name=n0conflict",
+            "-c",
+            "user.email=n0conflict@example.com",
+            "-c",
+            "commit.gpgsign=false",
+            *args,
+        ],
+        check=check,
+        capture_output=True,
+    )
+
+
+def _init_repo(repo: Path) -> None:
+    _git(repo, "init", "-q")
+    (repo / "app.py").write_text("x = 0\n")
+    _git(repo, "add", "app.py")
+    _git(repo, "commit", "-q", "-m", "base")
+
+
+class TestGetConflictedFiles:
+    def test_non_repo(self, tmp_path: Path):
+        assert get_conflicted_files(tmp_path) == (False, [])
+
+    def test_clean_repo(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        assert get_conflicted_files(tmp_path) == (True, [])
+
+    def test_merge_conflict(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _git(tmp_path, "checkout", "-q", "-b", "other")
+        (tmp_path / "app.py").write_text("x = 2\n")
+        _git(tmp_path, "commit", "-q", "-am", "other")
+        _git(tmp_path, "checkout", "-q", "-")
+        (tmp_path / "app.py").write_text("x = 1\n")
+        _git(tmp_path, "commit", "-q", "-am", "ours")
+        assert _git(tmp_path, "merge", "other", check=False).returncode != 0
+
+        is_repo, files = get_conflicted_files(tmp_path)
+        assert is_repo is True
+        assert files == [(tmp_path / "app.py").resolve()]
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from n0conflict.main import app
+from tests.test_git import _git, _init_repo
+
+runner = CliRunner()
+
+
+class TestScan:
+    def test_lists_unmerged_paths_that_cannot_be_read(self, tmp_path: Path):
+        # modify/delete conflict, then the surviving copy is removed too
+        _init_repo(tmp_path)
+        _git(tmp_path, "checkout", "-q", "-b", "other")
+        _git(tmp_path, "rm", "-q", "app.py")
+        _git(tmp_path, "commit", "-q", "-m", "delete")
+        _git(tmp_path, "checkout", "-q", "-")
+        (tmp_path / "app.py").write_text("x = 1\n")
+        _git(tmp_path, "commit", "-q", "-am", "modify")
+        assert _git(tmp_path, "merge", "other", check=False).returncode != 0
+        (tmp_path / "app.py").unlink()
+
+        result = runner.invoke(app, ["scan", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "No merge conflicts found" not in result.output
+        assert "app.py" in result.output
+        assert "?" in result.output
+
+    def test_clean_repo(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        result = runner.invoke(app, ["scan", str(tmp_path)])
+        assert "No merge conflicts found" in result.output
@@ -1,4 +1,51 @@
-from n0conflict.resolver import ResolutionResult, _parse_response
+from types import SimpleNamespace
+
+import anthropic
+
+from n0conflict.conflict import parse_conflicts
+from n0conflict.resolver import AIResolver, ResolutionResult, _parse_multi_response, _parse_response
+
+TWO_CONFLICTS = parse_conflicts(
+    "<<<<<<< HEAD\nx = 1\n=======\nx = 2\n>>>>>>> other\n"
+    "<<<<<<< HEAD\ny = 1\n=======\ny = 2\n>>>>>>> other\n"
+)
+
+
+def _api_error(cls: type, message: str) -> Exception:
+    """Build an SDK error without the HTTP request/response it normally wraps."""
+    error = cls.__new__(cls)
+    Exception.__init__(error, message)
+    return error
+
+
+def _response(text: str) -> SimpleNamespace:
+    return SimpleNamespace(content=[SimpleNamespace(text=text)], stop_reason="end_turn")
+
+
+class _FakeAsyncClient:
+    def __init__(self, create) -> None:
+        self.messages = SimpleNamespace(create=create)
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.closed = True
+
+
+def _resolver(create, create_async, async_clients: list | None = None) -> AIResolver:
+    resolver = AIResolver("test-key")
+    resolver._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    def new_async_client():
+        client = _FakeAsyncClient(create_async)
+        if async_clients is not None:
+            async_clients.append(client)
+        return client
+
+    resolver._new_async_client = new_async_client
+    return resolver
 
 
 class TestParseResponse:
@@ -25,3 +72,96 @@ class TestParseResponse:
         result = _parse_response("some raw code here")
         assert result.resolved is True
         assert result.content == "some raw code here"
+
+
+class TestParseMultiResponse:
+    def test_splits_results(self):
+        text = (
+            "--- RESULT 1 ---\n"
+            "RESOLVED:\nx = 1\n"
+            "--- RESULT 2 ---\n"
+            "CANNOT_RESOLVE:\nIncompatible changes.\n"
+        )
+        results = _parse_multi_response(text, 2)
+        assert [r.resolved for r in results] == [True, False]
+        assert "x = 1" in results[0].content
+        assert "Incompatible" in results[1].explanation
+
+    def test_count_mismatch_returns_empty(self):
+        text = "--- RESULT 1 ---\nRESOLVED:\nx = 1\n"
+        assert _parse_multi_response(text, 2) == []
+
+    def test_out_of_order_returns_empty(self):
+        text = (
+            "--- RESULT 2 ---\nRESOLVED:\ny = 2\n"
+            "--- RESULT 1 ---\nRESOLVED:\nx = 1\n"
+        )
+        assert _parse_multi_response(text, 2) == []
+
+
+class TestResolveMany:
+    def test_batched_answer(self):
+        def create(**kwargs):
+            return _response("--- RESULT 1 ---\nRESOLVED:\nx = 1\n--- RESULT 2 ---\nRESOLVED:\ny = 2\n")
+
+        async def create_async(**kwargs):
+            raise AssertionError("per-block fallback should not run")
+
+        results = _resolver(create, create_async).resolve_many(TWO_CONFLICTS)
+        assert [r.content for r in results] == ["x = 1\n", "y = 2\n"]
+
+    def test_fallback_isolates_api_errors(self):
+        def create(**kwargs):
+            return _response("not a batched answer")
+
+        async def create_async(**kwargs):
+            if "x = 1" in kwargs["messages"][0]["content"]:
+                raise _api_error(anthropic.RateLimitError, "rate limited")
+            return _response("RESOLVED:\ny = 2\n")
+
+        first, second = _resolver(create, create_async).resolve_many(TWO_CONFLICTS)
+        assert first.resolved is False
+        assert first.error is True
+        assert "rate limited" in first.explanation
+        assert second.resolved is True
+        assert second.error is False
+
+    def test_fallback_closes_its_async_client(self):
+        def create(**kwargs):
+            return _response("not a batched answer")
+
+        async def create_async(**kwargs):
+            return _response("RESOLVED:\nz = 0\n")
+
+        clients: list = []
+        resolver = _resolver(create, create_async, clients)
+        resolver.resolve_many(TWO_CONFLICTS)
+        resolver.resolve_many(TWO_CONFLICTS)
+        assert len(clients) == 2
+        assert all(client.closed for client in clients)
+
+    def test_bad_request_falls_back_per_block(self):
+        def create(**kwargs):
+            raise _api_error(anthropic.BadRequestError, "prompt is too long")
+
+        async def create_async(**kwargs):
+            return _response("RESOLVED:\nz = 0\n")
+
+        results = _resolver(create, create_async).resolve_many(TWO_CONFLICTS)
+        assert [r.resolved for r in results] == [True, True]
+
+    def test_rate_limit_and_auth_errors_skip_fallback(self):
+        for cls in (anthropic.RateLimitError, anthropic.AuthenticationError):
+            def create(**kwargs):
+                raise _api_error(cls, "refused")
+
+            async def create_async(**kwargs):
+                raise AssertionError("per-block fallback should not run")
+
+            clients: list = []
+            results = _resolver(create, create_async, clients).resolve_many(TWO_CONFLICTS)
+            assert clients == []
+            assert [(r.resolved, r.error, r.explanation) for r in results] == [
+                (False, True, "refused"),
+                (False, True, "refused"),
+            ]